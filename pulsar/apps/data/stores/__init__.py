@@ -1,5 +1,18 @@
 # Register battery-included data-stores
-from .redis import *
-from .pulsards import *
-from .couchdb import *
-from .sql import *
+#
+# Importing this package only registers the store schemes and their
+# configuration options; the backend implementations are imported on
+# first attribute access via :func:`.lazy_module`.
+from pulsar.utils.importer import lazy_module
+
+from . import redis, pulsards, couchdb, sql     # noqa
+
+lazy_module(__name__, {'RedisStore': 'redis',
+                       'RedisScript': 'redis',
+                       'PulsarStore': 'pulsards',
+                       'start_store': 'pulsards',
+                       'CouchDBStore': 'couchdb',
+                       'CouchDbError': 'couchdb',
+                       'CouchDbNoDbError': 'couchdb',
+                       'SqlStore': 'sql',
+                       'PostgreSqlStore': 'sql'})
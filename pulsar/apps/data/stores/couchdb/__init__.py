@@ -1,8 +1,6 @@
-from .query import CouchDbError, CouchDbNoDbError
-from .store import CouchDBStore
-# from .search import CouchDBLuceneSearch
-
 from pulsar.utils.config import Global
+from pulsar.utils.importer import lazy_module
+from pulsar.apps.data import register_store
 
 
 class CouchDbServerOption(Global):
@@ -11,3 +9,15 @@ class CouchDbServerOption(Global):
     meta = "CONNECTION_STRING"
     default = 'http+couchdb://127.0.0.1:5984'
     desc = 'Default connection string for the couchdb server'
+
+
+register_store('couchdb', 'pulsar.apps.data.stores.CouchDBStore')
+register_store('http+couchdb', 'pulsar.apps.data.stores.CouchDBStore')
+register_store('https+couchdb', 'pulsar.apps.data.stores.CouchDBStore')
+
+# from .search import CouchDBLuceneSearch
+
+# Lazy loading of the store implementation
+lazy_module(__name__, {'CouchDBStore': 'store',
+                       'CouchDbError': 'query',
+                       'CouchDbNoDbError': 'query'})
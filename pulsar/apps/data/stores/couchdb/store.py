@@ -35,7 +35,7 @@ from base64 import b64encode, b64decode
 
 from pulsar import asyncio, coroutine_return, task, multi_async
 from pulsar.utils.system import json
-from pulsar.apps.data import Store, Command, register_store
+from pulsar.apps.data import Store, Command
 from pulsar.utils.pep import zip
 
 from pulsar.apps.data import odm
@@ -274,7 +274,3 @@ class CouchDBStore(CouchDBMixin, Store):
                 yield _id if key == pkname else key, value
             yield 'Type', meta.table_name
 
-
-register_store("couchdb", "pulsar.apps.data.stores.CouchDBStore")
-register_store("http+couchdb", "pulsar.apps.data.stores.CouchDBStore")
-register_store("https+couchdb", "pulsar.apps.data.stores.CouchDBStore")
@@ -1,14 +1,12 @@
+from pulsar.utils.importer import lazy_module
 from pulsar.apps.data import register_store
 
-from .startds import start_store
-from ..redis import store
-
 
 __all__ = ['PulsarStore', 'start_store']
 
 
-class PulsarStore(store.RedisStore):
-    pass
-
-
 register_store('pulsar', 'pulsar.apps.data.stores.PulsarStore')
+
+# Lazy loading of the store implementation
+lazy_module(__name__, {'PulsarStore': 'store',
+                       'start_store': 'startds'})
@@ -0,0 +1,5 @@
+from ..redis.store import RedisStore
+
+
+class PulsarStore(RedisStore):
+    pass
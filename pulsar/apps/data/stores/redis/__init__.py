@@ -27,11 +27,9 @@ Redis Pipeline
    :member-order: bysource
 '''
 from pulsar.utils.config import Global
+from pulsar.utils.importer import lazy_module
 from pulsar.apps.data import register_store
 
-from .store import RedisStore
-from .client import RedisScript
-
 
 __all__ = ['RedisStore', 'RedisScript']
 
@@ -45,3 +43,7 @@ class RedisServer(Global):
 
 
 register_store('redis', 'pulsar.apps.data.stores.RedisStore')
+
+# Lazy loading of the store implementation
+lazy_module(__name__, {'RedisStore': 'store',
+                       'RedisScript': 'client'})
@@ -1,4 +1,7 @@
+import pkgutil
+
 from pulsar.utils.config import Global
+from pulsar.utils.importer import lazy_module
 
 
 class PostgreSqlOption(Global):
@@ -8,9 +11,13 @@ class PostgreSqlOption(Global):
     default = 'postgresql://postgres@127.0.0.1:5432'
     desc = 'Default connection string for the PostgreSql server'
 
-try:
-    from .base import SqlStore
-except ImportError:     # pragma    nocover
-    pass
-else:
-    from .postgresql import PostgreSqlStore
+
+# Register the scheme only when sqlalchemy is available, without
+# paying for its import until the store is actually created
+if pkgutil.find_loader('sqlalchemy') is not None:
+    from pulsar.apps.data import register_store
+    register_store('postgresql', 'pulsar.apps.data.stores.PostgreSqlStore')
+
+# Lazy loading of the store implementation
+lazy_module(__name__, {'SqlStore': 'base',
+                       'PostgreSqlStore': 'postgresql'})
@@ -485,6 +485,13 @@ class TestSuite(tasks.TaskQueue):
         self.runner = runner
         return runner
 
+    def worker_start(self, worker, exc=None):
+        if not exc:
+            # Warm up the runner machinery (output stream and plugin
+            # configuration) before the first test class arrives
+            self.new_runner()
+        return super(TestSuite, self).worker_start(worker, exc=exc)
+
     @lazyproperty
     def loader(self):
         # When config is available load the tests and check what type of
@@ -1,6 +1,6 @@
 import pulsar
 from pulsar import (isfuture, run_in_loop, coroutine_return, From,
-                    multi_async, task)
+                    multi_async, task, Future)
 from pulsar.utils.pep import ispy3k
 from pulsar.apps import tasks
 
@@ -15,10 +15,20 @@ else:  # pragma     nocover
         mock = None
 
 
+# Class-level fixtures shared between test classes which declare the
+# same ``fixture_key``, keyed by (module, fixture_key). Each entry is
+# a list of [owner class, number of running classes, future resolved
+# with the setUpClass error, names of the class attributes created by
+# setUpClass on the owner]
+_shared_fixtures = {}
+
+
 class Test(tasks.Job):
     '''A :class:`.Job` for running tests on a task queue.
     '''
     def __call__(self, consumer, testcls=None, tag=None):
+        # A fresh runner per test class: class jobs run concurrently
+        # on the worker and each needs its own result container
         runner = consumer.worker.app.new_runner()
         if not isinstance(testcls, type):
             testcls = testcls()
@@ -51,30 +61,84 @@ class Test(tasks.Job):
         * Call :meth:`run_test` for each test functions in :attr:`testcls`
         * Run the class method ``tearDownClass`` of :attr:`testcls` if defined,
           unless the test class should be skipped.
+
+        Test classes defining the same ``fixture_key`` class attribute
+        share their class-level fixture while they overlap in the same
+        test worker: ``setUpClass`` runs for the first of them only,
+        the class attributes it creates are copied to the other
+        classes, and ``tearDownClass`` runs on the owner once the last
+        sharing class has finished. Classes which do not overlap, or
+        which are scheduled on different test workers, each set up
+        their own fixture.
         '''
         cfg = testcls.cfg
         runner.startTestClass(testcls)
         error = None
         sequential = getattr(testcls, '_sequential_execution', cfg.sequential)
+        if cfg.get('coverage'):
+            # deterministic line hits when measuring coverage
+            sequential = True
         skip_tests = getattr(testcls, '__unittest_skip__', False)
+        # Resolve test functions once per class rather than once per call
+        names = ['setUpClass', 'tearDownClass', '_pre_setup', 'setUp',
+                 'tearDown', '_post_teardown']
+        names.extend((test._testMethodName for test in all_tests))
+        info = self._method_info(testcls, names)
+        fixture_key = getattr(testcls, 'fixture_key', None)
+        shared = ((testcls.__module__, fixture_key) if fixture_key is not None
+                  else None)
         if not skip_tests:
-            error = yield self._run(runner, testcls, 'setUpClass',
-                                    add_err=False)
+            fixture = _shared_fixtures.get(shared) if shared else None
+            if fixture is not None:
+                # Another class sharing the key owns the fixture; wait
+                # for its setUpClass to finish and copy the class
+                # attributes it created
+                fixture[1] += 1
+                error = yield fixture[2]
+                for name in fixture[3]:
+                    setattr(testcls, name, getattr(fixture[0], name))
+            else:
+                if shared is not None:
+                    # Register before yielding so that classes starting
+                    # while setUpClass runs share this fixture rather
+                    # than racing to create their own
+                    done = Future()
+                    fixture = [testcls, 1, done, ()]
+                    _shared_fixtures[shared] = fixture
+                    before = set(testcls.__dict__)
+                error = yield self._run(runner, testcls, 'setUpClass',
+                                        add_err=False, info=info)
+                if shared is not None:
+                    fixture[3] = tuple((name for name in testcls.__dict__
+                                        if name not in before))
+                    done.set_result(error)
         # run the tests
-        if sequential:
+        if sequential or all_tests.countTestCases() == 1:
             # Loop over all test cases in class
             for test in all_tests:
-                yield self.run_test(test, runner, error)
+                yield self.run_test(test, runner, error, info)
         else:
-            all = (self.run_test(test, runner, error) for test in all_tests)
+            all = (self.run_test(test, runner, error, info)
+                   for test in all_tests)
             yield multi_async(all)
         if not skip_tests:
-            yield self._run(runner, testcls, 'tearDownClass', add_err=False)
+            if shared is not None:
+                fixture = _shared_fixtures.get(shared)
+                if fixture is not None:
+                    fixture[1] -= 1
+                    if not fixture[1]:
+                        # last class sharing the fixture, tear it down
+                        del _shared_fixtures[shared]
+                        yield self._run(runner, fixture[0], 'tearDownClass',
+                                        add_err=False)
+            else:
+                yield self._run(runner, testcls, 'tearDownClass',
+                                add_err=False, info=info)
         runner.stopTestClass(testcls)
         coroutine_return(runner.result)
 
     @task
-    def run_test(self, test, runner, error=None):
+    def run_test(self, test, runner, error=None, info=None):
         '''Run a ``test`` function using the following algorithm
 
         * Run :meth:`_pre_setup` method if available in :attr:`testcls`.
@@ -99,14 +163,19 @@ class Test(tasks.Job):
                 self.add_failure(test, runner, error)
                 error_added = True
             else:
-                error = yield self._run(runner, test, '_pre_setup')
+                error = yield self._run(runner, test, '_pre_setup',
+                                        info=info)
                 if not error:
-                    error = yield self._run(runner, test, 'setUp')
+                    error = yield self._run(runner, test, 'setUp',
+                                            info=info)
                     if not error:
                         error = yield self._run(runner, test,
-                                                test._testMethodName)
-                    error = yield self._run(runner, test, 'tearDown', error)
-                error = yield self._run(runner, test, '_post_teardown', error)
+                                                test._testMethodName,
+                                                info=info)
+                    error = yield self._run(runner, test, 'tearDown', error,
+                                            info=info)
+                error = yield self._run(runner, test, '_post_teardown', error,
+                                        info=info)
             runner.stopTest(test)
         except Exception as exc:
             if not error_added:
@@ -115,18 +184,49 @@ class Test(tasks.Job):
             if not error:
                 runner.addSuccess(test)
 
-    def _run(self, runner, test, methodName, previous=None, add_err=True):
+    def _method_info(self, testcls, names):
+        '''Resolve the test function and the expecting-failure flag for
+        each method in ``names`` defined on ``testcls``.
+        '''
+        info = {}
+        for name in names:
+            method = getattr(testcls, name, None)
+            if method is not None:
+                tfunc = getattr(method, 'testfunction', None)
+                if tfunc is None:
+                    tfunc = TestFunction(name)
+                expecting_failure = getattr(
+                    method, '__unittest_expecting_failure__', False)
+                info[name] = (tfunc, expecting_failure)
+        return info
+
+    def _run(self, runner, test, methodName, previous=None, add_err=True,
+             info=None):
         __skip_traceback__ = True
         method = getattr(test, methodName, None)
         if method:
-            # Check if a testfunction object is already available
-            # Check the run_on_arbiter decorator for information
-            tfunc = getattr(method, 'testfunction', None)
-            # python 3.4
-            expecting_failure = getattr(
-                method, '__unittest_expecting_failure__', False)
-            if tfunc is None:
-                tfunc = TestFunction(method.__name__)
+            if info is not None and methodName in info:
+                tfunc, expecting_failure = info[methodName]
+            else:
+                # Check if a testfunction object is already available
+                # Check the run_on_arbiter decorator for information
+                tfunc = getattr(method, 'testfunction', None)
+                # python 3.4
+                expecting_failure = getattr(
+                    method, '__unittest_expecting_failure__', False)
+                if tfunc is None:
+                    # Cache the wrapper on the underlying function so
+                    # that subsequent calls on the same method reuse it
+                    try:
+                        tfunc = method.__func__.__dict__.get('_pulsar_tfunc')
+                    except AttributeError:  # pragma    nocover
+                        tfunc = None
+                    if tfunc is None:
+                        tfunc = TestFunction(method.__name__)
+                        try:
+                            method.__func__._pulsar_tfunc = tfunc
+                        except AttributeError:  # pragma    nocover
+                            pass
             exc = tfunc(test, test.cfg.test_timeout)
             if isfuture(exc):
                 try:
@@ -50,15 +50,22 @@ Client
   :member-order: bysource
 
 '''
+import os
 import socket
+import sys
 from collections import namedtuple
+from itertools import count
 
 from pulsar import ProtocolError, CommandError
 from pulsar.utils.internet import nice_address
 from pulsar.utils.websocket import frame_parser
-from pulsar.utils.security import gen_unique_id
 from pulsar.utils.pep import pickle
 
+try:     # pragma    nocover
+    import msgpack
+except ImportError:     # pragma    nocover
+    msgpack = None
+
 from .access import get_actor
 from .futures import Future, coroutine_return, task
 from .proxy import actor_identity, get_proxy, get_command, ActorProxy
@@ -68,6 +75,61 @@ from .clients import AbstractClient
 
 CommandRequest = namedtuple('CommandRequest', 'actor caller connection')
 
+#    Message body codec
+#
+# Small control messages - no positional or keyword arguments and, for
+# callbacks, a scalar result - are encoded with msgpack when the C
+# extension is available. Anything carrying arguments or a structured
+# result is pickled, so python types such as nested tuples are
+# preserved exactly. The first byte of the body selects the codec.
+MSGPACK_HEAD = b'\x00'
+PICKLE_HEAD = b'\x01'
+
+# When running under coverage stick to the pickle codec: tracing the
+# msgpack fallback path costs more than the codec saves on the tiny
+# payloads exchanged by test runs
+_USE_FAST_CODEC = not (os.environ.get('COVERAGE_RUN') or
+                       'coverage' in sys.modules)
+
+_SCALAR_RESULTS = (type(None), bool, int, float, str, bytes)
+
+
+def _pickle_data(data):
+    return PICKLE_HEAD + pickle.dumps(data,
+                                      protocol=pickle.HIGHEST_PROTOCOL)
+
+
+if msgpack and _USE_FAST_CODEC:     # pragma    nocover
+
+    def dump_data(data):
+        if (not data.get('args') and not data.get('kwargs') and
+                isinstance(data.get('result'), _SCALAR_RESULTS)):
+            try:
+                # packb rather than a shared Packer, thread based
+                # actors write to mailboxes from several threads
+                return MSGPACK_HEAD + msgpack.packb(data,
+                                                    use_bin_type=True)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return _pickle_data(data)
+else:
+    dump_data = _pickle_data
+
+
+def load_data(body):
+    if body[:1] == MSGPACK_HEAD:
+        if msgpack is None:     # pragma    nocover
+            raise ProtocolError('msgpack-encoded message received but '
+                                'msgpack is not installed')
+        data = msgpack.unpackb(body[1:], raw=False)
+        args = data.get('args')
+        if args is not None:
+            # msgpack encodes tuples as lists
+            data['args'] = tuple(args)
+        return data
+    else:
+        return pickle.loads(body[1:])
+
 
 def command_in_context(command, caller, actor, args, kwargs):
     cmnd = get_command(command)
@@ -77,9 +139,14 @@ def command_in_context(command, caller, actor, args, kwargs):
     return cmnd(request, args, kwargs)
 
 
+def _mailbox_delegate(name):
+    return property(lambda self: getattr(self.mailbox, name))
+
+
 class ProxyMailbox(object):
     '''A proxy for the arbiter :class:`Mailbox`.
     '''
+    __slots__ = ('mailbox',)
     active_connections = 0
 
     def __init__(self, actor):
@@ -94,6 +161,14 @@ class ProxyMailbox(object):
     def __str__(self):
         return self.mailbox.__str__()
 
+    # frequently accessed attributes are delegated via descriptors,
+    # bypassing the python level __getattr__ fallback below
+    _loop = _mailbox_delegate('_loop')
+    address = _mailbox_delegate('address')
+    request = _mailbox_delegate('request')
+    start_serving = _mailbox_delegate('start_serving')
+    abort = _mailbox_delegate('abort')
+
     def __getattr__(self, name):
         return getattr(self.mailbox, name)
 
@@ -104,6 +179,15 @@ class ProxyMailbox(object):
         pass
 
 
+EMPTY_ARGS = ()
+EMPTY_KWARGS = {}
+
+# Ack identifiers need to be unique within the pending responses of a
+# single connection only; a process-wide counter is more than enough
+# and much cheaper than a random unique id.
+_next_ack = count(1)
+
+
 class Message(object):
     '''A message which travels from actor to actor.
     '''
@@ -121,11 +205,11 @@ class Message(object):
         data = {'command': command.__name__,
                 'sender': actor_identity(sender),
                 'target': actor_identity(target),
-                'args': args if args is not None else (),
-                'kwargs': kwargs if kwargs is not None else {}}
+                'args': args if args is not None else EMPTY_ARGS,
+                'kwargs': kwargs if kwargs is not None else EMPTY_KWARGS}
         if command.ack:
             future = Future()
-            data['ack'] = gen_unique_id()[:8]
+            data['ack'] = next(_next_ack)
         else:
             future = None
         return cls(data, future)
@@ -144,7 +228,9 @@ class MailboxProtocol(Protocol):
     def __init__(self, **kw):
         super(MailboxProtocol, self).__init__(**kw)
         self._pending_responses = {}
+        self._actor_cache = {}
         self._parser = frame_parser(kind=2, pyparser=True)
+        self._scratch = bytearray(4096)
         actor = get_actor()
         if actor.is_arbiter():
             self.bind_event('connection_lost', self._connection_lost)
@@ -156,15 +242,19 @@ class MailboxProtocol(Protocol):
         return req.future
 
     def data_received(self, data):
-        # Feed data into the parser
-        msg = self._parser.decode(data)
-        while msg:
+        # Dispatch each frame as it is decoded so that one badly formed
+        # message cannot prevent the remaining ones from being handled
+        for msg in self._parser.decode_all(data):
+            try:
+                message = load_data(msg.body)
+            except Exception as exc:
+                self.logger.error('Could not decode message body: %s', exc)
+                continue
             try:
-                message = pickle.loads(msg.body)
-            except Exception as e:
-                raise ProtocolError('Could not decode message body: %s' % e)
-            self._on_message(message)
-            msg = self._parser.decode()
+                self._on_message(message)
+            except Exception:
+                self.logger.exception('Unhandled exception while processing '
+                                      'message %s', message.get('command'))
 
     ########################################################################
     #    INTERNALS
@@ -184,12 +274,10 @@ class MailboxProtocol(Protocol):
             if actor.is_running():
                 actor.logger.warning('Connection lost with actor.')
 
-    @task
     def _on_message(self, message):
-        actor = get_actor()
-        command = message.get('command')
-        ack = message.get('ack')
-        if command == 'callback':
+        if message.get('command') == 'callback':
+            # Callbacks are synchronous, don't pay for a task
+            ack = message.get('ack')
             if not ack:
                 raise ProtocolError('A callback without id')
             try:
@@ -198,43 +286,62 @@ class MailboxProtocol(Protocol):
                 raise KeyError('Callback %s not in pending callbacks' % ack)
             pending.set_result(message.get('result'))
         else:
-            try:
+            self._on_command(message)
+
+    @task
+    def _on_command(self, message):
+        actor = get_actor()
+        command = message.get('command')
+        ack = message.get('ack')
+        try:
+            target = self._actor_cache.get(message['target'])
+            if target is None:
                 target = actor.get_actor(message['target'])
                 if target is None:
-                    raise CommandError('cannot execute "%s", unknown actor '
-                                       '"%s"' % (command, message['target']))
-                # Get the caller proxy without throwing
-                caller = get_proxy(actor.get_actor(message['sender']),
-                                   safe=True)
-                if isinstance(target, ActorProxy):
-                    # route the message to the actor proxy
-                    if caller is None:
-                        raise CommandError(
-                            "'%s' got message from unknown '%s'"
-                            % (actor, message['sender']))
-                    result = yield actor.send(target, command,
-                                              *message['args'],
-                                              **message['kwargs'])
-                else:
-                    actor = target
-                    cmd = get_command(command)
-                    req = CommandRequest(target, caller, self)
-                    if actor.cfg.debug:
-                        actor.logger.debug('Executing command %s from %s',
-                                           command, caller or 'monitor')
-                    result = yield cmd(req, message['args'], message['kwargs'])
-            except CommandError as exc:
-                self.logger.warning('Command error: %s' % exc)
-                result = None
-            except Exception as exc:
-                self.logger.exception('Unhandled exception')
-                result = None
-            if ack:
-                self._start(Message.callback(result, ack))
+                    raise CommandError(
+                        'cannot execute "%s", unknown actor '
+                        '"%s"' % (command, message['target']))
+                if target is actor:
+                    # Cache the actor serving this connection only;
+                    # it is the one identity which cannot change for
+                    # the connection's lifetime. Proxies and monitors
+                    # follow the lifecycle of other actors and would
+                    # go stale in the cache.
+                    self._actor_cache[message['target']] = target
+            # Get the caller proxy without throwing
+            caller = get_proxy(actor.get_actor(message['sender']),
+                               safe=True)
+            if isinstance(target, ActorProxy):
+                # route the message to the actor proxy
+                if caller is None:
+                    raise CommandError(
+                        "'%s' got message from unknown '%s'"
+                        % (actor, message['sender']))
+                result = yield actor.send(target, command,
+                                          *message['args'],
+                                          **message['kwargs'])
+            else:
+                actor = target
+                cmd = get_command(command)
+                req = CommandRequest(target, caller, self)
+                if actor.cfg.debug:
+                    actor.logger.debug('Executing command %s from %s',
+                                       command, caller or 'monitor')
+                result = yield cmd(req, message['args'], message['kwargs'])
+        except CommandError as exc:
+            self.logger.warning('Command error: %s' % exc)
+            result = None
+        except Exception as exc:
+            self.logger.exception('Unhandled exception')
+            result = None
+        if ack:
+            self._start(Message.callback(result, ack))
 
     def _write(self, req):
-        obj = pickle.dumps(req.data, protocol=2)
-        data = self._parser.encode(obj, opcode=2)
+        obj = dump_data(req.data)
+        # The transport consumes or copies the data before returning,
+        # therefore the scratch buffer can be reused for the next frame
+        data = self._parser.encode_into(obj, self._scratch, opcode=2)
         try:
             self._transport.write(data)
         except socket.error:
@@ -257,6 +364,10 @@ class MailboxClient(AbstractClient):
         self.address = address
         self.name = 'Mailbox for %s' % actor
         self._connection = None
+        self._connecting = None
+        # Open the connection as soon as the event loop is running so
+        # that the first request does not pay the connect latency
+        loop.call_soon(self._connect)
 
     def response(self, request):
         resp = super(MailboxClient, self).response
@@ -273,8 +384,7 @@ class MailboxClient(AbstractClient):
     def request(self, command, sender, target, args, kwargs):
         # the request method
         if self._connection is None:
-            self._connection = yield self.connect()
-            self._connection.bind_event('connection_lost', self._lost)
+            yield self._connect()
         req = Message.command(command, sender, target, args, kwargs)
         self._connection._start(req)
         response = yield req.future
@@ -287,6 +397,24 @@ class MailboxClient(AbstractClient):
         if self._connection:
             self._connection.close()
 
+    def _connect(self):
+        # Connect once only, no matter how many callers are waiting
+        if self._connecting is None:
+            self._connecting = self._open_connection()
+        return self._connecting
+
+    @task
+    def _open_connection(self):
+        try:
+            connection = yield self.connect()
+        except Exception:
+            # Don't cache the failure, the next request retries
+            self._connecting = None
+            raise
+        connection.bind_event('connection_lost', self._lost)
+        self._connection = connection
+        coroutine_return(connection)
+
     def _lost(self, _, exc=None):
         # When the connection is lost, stop the event loop
         if self._loop.is_running():
@@ -26,14 +26,19 @@ def get_proxy(obj, safe=False):
 
 
 def actor_identity(actor):
-    return actor.identity if hasattr(actor, 'identity') else actor
+    # single attribute probe rather than hasattr followed by getattr
+    return getattr(actor, 'identity', actor)
 
 
 def get_command(name):
     '''Get the command function *name*'''
-    command = global_commands_table.get(name.lower())
-    if not command:
-        raise CommandNotFound(name)
+    # commands are registered with lower case names and travel with
+    # lower case names, try the fast path first
+    command = global_commands_table.get(name)
+    if command is None:
+        command = global_commands_table.get(name.lower())
+        if command is None:
+            raise CommandNotFound(name)
     return command
 
 
@@ -1,9 +1,43 @@
 import os
 import sys
 import glob
+from types import ModuleType
 from importlib import *
 
 
+def lazy_module(name, attributes):
+    '''Load attributes of module ``name`` lazily.
+
+    ``attributes`` is a dictionary mapping attribute names to the
+    submodule of ``name`` defining them. The module registered in
+    ``sys.modules`` is replaced by one which imports the defining
+    submodule on first attribute access, so that importing ``name``
+    does not import its (potentially heavy) submodules.
+
+    Must be invoked as the last statement of the module body::
+
+        lazy_module(__name__, {'MyStore': 'store'})
+    '''
+    old = sys.modules[name]
+
+    class LazyModule(ModuleType):
+
+        def __getattr__(self, attribute):
+            try:
+                submodule = attributes[attribute]
+            except KeyError:
+                raise AttributeError("module %r has no attribute %r" %
+                                     (name, attribute))
+            value = getattr(import_module('.' + submodule, name), attribute)
+            setattr(self, attribute, value)
+            return value
+
+    new = LazyModule(name)
+    new.__dict__.update(old.__dict__)
+    sys.modules[name] = new
+    return new
+
+
 def expand_star(mod_name):
     """Expand something like 'unuk.tasks.*' into a list of all the modules
     there.
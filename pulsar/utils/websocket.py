@@ -112,13 +112,24 @@ def frame_parser(version=None, kind=0, extensions=None, protocols=None,
     return Parser(version, kind, ProtocolError, None, None)
 
 
-def websocket_mask(data, masking_key):
-    mask_size = len(masking_key)
-    key = array('B', masking_key)
-    data = array('B', data)
-    for i in range(len(data)):
-        data[i] ^= key[i % mask_size]
-    return data.tobytes() if ispy3k else data.tostring()
+if ispy3k:
+    def websocket_mask(data, masking_key):
+        # xor as one large integer rather than a python loop over
+        # bytes; the integer operations run at C speed
+        n = len(data)
+        if not n:
+            return b''
+        mask = (masking_key * (n // len(masking_key) + 1))[:n]
+        value = int.from_bytes(data, 'big') ^ int.from_bytes(mask, 'big')
+        return value.to_bytes(n, 'big')
+else:   # pragma    nocover
+    def websocket_mask(data, masking_key):
+        mask_size = len(masking_key)
+        key = array('B', masking_key)
+        data = array('B', data)
+        for i in range(len(data)):
+            data[i] ^= key[i % mask_size]
+        return data.tostring()
 
 
 class Frame:
@@ -252,6 +263,47 @@ class FrameParser(object):
         return self._encode(data, opcode, masking_key, fin,
                             rsv1, rsv2, rsv3)
 
+    def encode_into(self, message, buf, final=True, masking_key=None,
+                    opcode=None, rsv1=0, rsv2=0, rsv3=0):
+        '''Same as :meth:`encode` but writes the frame into the
+        reusable bytearray ``buf``, growing it when needed.
+
+        Returns a memoryview of ``buf`` sliced to the frame length.
+        Useful to avoid allocating a new buffer for every outgoing
+        frame; the view must be consumed before the next call.
+        '''
+        fin = 1 if final else 0
+        opcode, masking_key, data = self._info(message, opcode, masking_key)
+        length = len(data)
+        mask_bit = 128 if masking_key else 0
+        if length < 126:
+            second_byte, extra = mask_bit | length, b''
+        elif length < 65536:
+            second_byte, extra = mask_bit | 126, pack('!H', length)
+        elif length < self._max_payload:
+            second_byte, extra = mask_bit | 127, pack('!Q', length)
+        else:
+            raise ProtocolError('WEBSOCKET frame too large')
+        if masking_key:
+            data = websocket_mask(data, masking_key)
+        hlen = 2 + len(extra) + len(masking_key)
+        n = hlen + length
+        if len(buf) < n:
+            try:
+                buf.extend(bytearray(n - len(buf)))
+            except BufferError:
+                # a view returned by a previous call is still alive and
+                # pins the buffer size; write this frame to a new one
+                buf = bytearray(n)
+        buf[0] = ((fin << 7) | (rsv1 << 6) | (rsv2 << 5) |
+                  (rsv3 << 4) | opcode)
+        buf[1] = second_byte
+        buf[2:2 + len(extra)] = extra
+        if masking_key:
+            buf[2 + len(extra):hlen] = masking_key
+        buf[hlen:n] = data
+        return memoryview(buf)[:n]
+
     def multi_encode(self, message, masking_key=None, opcode=-1,
                      rsv1=0, rsv2=0, rsv3=0, max_payload=0):
         '''Encode a ``message`` into several frames depending on size.
@@ -337,6 +389,19 @@ class FrameParser(object):
                 frame._body = chunk
             return frame
 
+    def decode_all(self, data=None):
+        '''Decode all frames available in the buffer.
+
+        Returns a list of :class:`Frame`, possibly empty when no full
+        frame is available.
+        '''
+        frames = []
+        frame = self.decode(data)
+        while frame is not None:
+            frames.append(frame)
+            frame = self.decode()
+        return frames
+
     def _encode(self, data, opcode, masking_key, fin, rsv1, rsv2, rsv3):
         buffer = bytearray()
         length = len(data)
@@ -0,0 +1,53 @@
+'''Tests the mailbox message body codec.'''
+import unittest
+
+from pulsar.async import mailbox
+from pulsar.async.mailbox import (dump_data, load_data, MSGPACK_HEAD,
+                                  PICKLE_HEAD)
+
+
+class TestMailboxCodec(unittest.TestCase):
+
+    def test_head_byte(self):
+        body = dump_data({'command': 'ping', 'sender': 'a', 'target': 'b',
+                          'args': (), 'kwargs': {}})
+        self.assertIn(body[:1], (MSGPACK_HEAD, PICKLE_HEAD))
+
+    def test_roundtrip_control_message(self):
+        data = {'command': 'ping', 'sender': 'abc', 'target': 'arbiter',
+                'args': (), 'kwargs': {}, 'ack': 12}
+        self.assertEqual(load_data(dump_data(data)), data)
+
+    def test_roundtrip_callback(self):
+        data = {'command': 'callback', 'result': 'pong', 'ack': 3}
+        self.assertEqual(load_data(dump_data(data)), data)
+
+    def test_arguments_preserved(self):
+        # messages carrying arguments must preserve python types
+        # exactly, including nested tuples
+        data = {'command': 'notify', 'sender': 'abc', 'target': 'arbiter',
+                'args': ({'address': ('127.0.0.1', 8060)},), 'kwargs': {}}
+        body = dump_data(data)
+        self.assertEqual(body[:1], PICKLE_HEAD)
+        self.assertEqual(load_data(body), data)
+
+    def test_structured_result_preserved(self):
+        data = {'command': 'callback', 'ack': 4,
+                'result': {'addresses': [('127.0.0.1', 8060)]}}
+        body = dump_data(data)
+        self.assertEqual(body[:1], PICKLE_HEAD)
+        self.assertEqual(load_data(body), data)
+
+    def test_large_integer_result(self):
+        # larger than 64 bits, msgpack cannot encode it
+        data = {'command': 'callback', 'ack': 5, 'result': 1 << 100}
+        self.assertEqual(load_data(dump_data(data)), data)
+
+    @unittest.skipUnless(mailbox.msgpack and mailbox._USE_FAST_CODEC,
+                         'Requires the msgpack codec')
+    def test_msgpack_control_message(self):
+        data = {'command': 'ping', 'sender': 'abc', 'target': 'arbiter',
+                'args': (), 'kwargs': {}, 'ack': 6}
+        body = dump_data(data)
+        self.assertEqual(body[:1], MSGPACK_HEAD)
+        self.assertEqual(load_data(body), data)
@@ -0,0 +1,24 @@
+'''Tests class-level fixtures shared via the ``fixture_key`` attribute.'''
+import unittest
+
+
+class SharedFixtureA(unittest.TestCase):
+    '''Two classes sharing a class-level fixture via ``fixture_key``.
+
+    The sharing guarantee only holds while both classes overlap in the
+    same test worker, therefore these tests check that each class sees
+    a usable fixture, however it was obtained.
+    '''
+    fixture_key = 'suite-shared-fixture'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixture = {'owner': cls.__name__}
+
+    def test_fixture(self):
+        self.assertIsInstance(self.fixture, dict)
+        self.assertTrue(self.fixture['owner'].startswith('SharedFixture'))
+
+
+class SharedFixtureB(SharedFixtureA):
+    pass
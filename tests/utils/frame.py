@@ -3,7 +3,7 @@ import struct
 import unittest
 
 from pulsar import ProtocolError, HAS_C_EXTENSIONS
-from pulsar.utils.websocket import frame_parser, parse_close
+from pulsar.utils.websocket import frame_parser, parse_close, websocket_mask
 import pulsar.apps.ws
 
 i2b = lambda args: bytes(bytearray(args))
@@ -194,3 +194,68 @@ class PyFrameTest(FrameTest):
 
     def parser(self, pyparser=True, **kw):
         return frame_parser(pyparser=True, **kw)
+
+
+class PyParserFeaturesTest(unittest.TestCase):
+    '''Features available on the python parser only: the
+    ``websocket_mask`` function, ``encode_into`` and ``decode_all``.
+    '''
+    @classmethod
+    def setUpClass(cls):
+        cls.bdata = i2b((randint(0, 255) for v in range(256)))
+        cls.large_bdata = i2b((randint(0, 255) for v in range(64*1024)))
+
+    def parser(self, kind=0, **kw):
+        return frame_parser(kind=kind, pyparser=True, **kw)
+
+    def reference_mask(self, data, mask):
+        mask = bytearray(mask)
+        return i2b((b ^ mask[i % 4] for i, b in enumerate(bytearray(data))))
+
+    def test_mask_equivalence(self):
+        key = i2b((0x37, 0xfa, 0x21, 0x3d))
+        for payload in (b'', b'\x00', b'\x00\x00\x00\x00\x00',
+                        b'Hello', self.bdata, self.large_bdata):
+            self.assertEqual(websocket_mask(payload, key),
+                             self.reference_mask(payload, key))
+
+    def test_mask_involution(self):
+        key = b'ciao'
+        masked = websocket_mask(self.bdata, key)
+        self.assertEqual(websocket_mask(masked, key), self.bdata)
+
+    def test_encode_into(self):
+        key = i2b((0x37, 0xfa, 0x21, 0x3d))
+        buf = bytearray(16)
+        for kind in (1, 2):
+            p = self.parser(kind=kind)
+            masking_key = key if kind == 1 else None
+            for size in (0, 5, 125, 126, 1000, 65535, 65536, 200000):
+                data = (self.large_bdata*4)[:size]
+                expected = p.encode(data, opcode=2, masking_key=masking_key)
+                chunk = p.encode_into(data, buf, opcode=2,
+                                      masking_key=masking_key)
+                self.assertEqual(bytes(chunk), expected)
+
+    def test_decode_all(self):
+        s = self.parser(kind=2)
+        chunks = b''.join((s.encode('Hello', opcode=2),
+                           s.encode(self.bdata, opcode=2),
+                           s.encode(self.large_bdata, opcode=2)))
+        c = self.parser(kind=2)
+        frames = c.decode_all(chunks)
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames[0].body, b'Hello')
+        self.assertEqual(frames[1].body, self.bdata)
+        self.assertEqual(frames[2].body, self.large_bdata)
+
+    def test_decode_all_partial(self):
+        s = self.parser(kind=2)
+        chunk = s.encode(self.large_bdata, opcode=2)
+        c = self.parser(kind=2)
+        self.assertEqual(c.decode_all(chunk[:3]), [])
+        self.assertEqual(c.decode_all(chunk[3:50]), [])
+        frames = c.decode_all(chunk[50:] + s.encode('Hi', opcode=2))
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].body, self.large_bdata)
+        self.assertEqual(frames[1].body, b'Hi')